@@ -30,6 +30,7 @@ class Settings:
     seats_json_path: Path = Path(os.getenv("SEATS_JSON_PATH", "data/seats.json"))
     hold_ttl_seconds: int = int(os.getenv("SEAT_HOLD_TTL_SECONDS", "120"))
     cleanup_interval_seconds: int = int(os.getenv("SEAT_CLEANUP_INTERVAL_SECONDS", "5"))
+    cleanup_batch_size: int = int(os.getenv("SEAT_CLEANUP_BATCH_SIZE", "500"))
     redis_url: Optional[str] = os.getenv("REDIS_URL")
     allow_redis: bool = os.getenv("ENABLE_REDIS", "false").lower() in {"1", "true", "yes"}
     admin_token: Optional[str] = os.getenv("ADMIN_TOKEN", "1223")
@@ -48,18 +49,18 @@ class Settings:
         "FF0070C0": "E",     # blue
     })
 
+    def __post_init__(self) -> None:
+        self.compile_color_tiers()
+
+    def compile_color_tiers(self) -> None:
+        # Key by the last 6 hex digits so ARGB values with any alpha prefix
+        # resolve with a single dict lookup.
+        self._trimmed_tiers = {key.upper()[-6:]: tier for key, tier in self.color_tiers.items()}
+
     def tier_for_color(self, color: Optional[str]) -> Optional[str]:
         if not color:
             return None
-        color_upper = color.upper()
-        if color_upper in self.color_tiers:
-            return self.color_tiers[color_upper]
-        # Some Excel exports use ARGB with leading alpha "00"
-        trimmed = color_upper[-6:]
-        for key, tier in self.color_tiers.items():
-            if key.endswith(trimmed):
-                return tier
-        return None
+        return self._trimmed_tiers.get(color.upper()[-6:])
 
     def price_for_tier(self, tier: Optional[str]) -> int:
         if not tier:
@@ -72,6 +73,7 @@ def get_settings() -> Settings:
     settings = Settings()
     # Allow overriding mappings via env string/JSON
     settings.color_tiers = _load_mapping("COLOR_TIER_MAP", settings.color_tiers)
+    settings.compile_color_tiers()
     tier_price_map = {k: str(v) for k, v in settings.tier_prices.items()}
     raw_prices = _load_mapping("TIER_PRICE_MAP", tier_price_map)
     # Ensure values are ints
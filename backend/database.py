@@ -1,19 +1,50 @@
-﻿from sqlalchemy import create_engine
+﻿from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from .config import get_settings
 
 settings = get_settings()
-connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-engine = create_engine(settings.database_url, connect_args=connect_args, future=True)
+if settings.database_url.startswith("sqlite"):
+    # SQLite serializes writes itself; busy_timeout handles contention, so the
+    # default pool is enough.
+    engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False},
+        future=True,
+    )
+else:
+    engine = create_engine(
+        settings.database_url,
+        future=True,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+if settings.database_url.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False, future=True)
+
+# Module-level binding so the hot Depends path resolves the factory with a
+# single global load instead of going through attribute lookup per request.
+make_session = SessionLocal
 
 Base = declarative_base()
 
 
 def get_session():
-    session = SessionLocal()
+    session = make_session()
     try:
         yield session
     finally:
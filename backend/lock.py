@@ -3,7 +3,9 @@
 from datetime import datetime, timedelta
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from .config import get_settings
@@ -11,37 +13,43 @@ from .models import Hold, Seat, SeatStatus
 
 
 class _RedisHelper:
+    # Compare-and-delete / compare-and-expire as atomic server-side scripts:
+    # one round trip each, no WATCH/MULTI retry loop.
+    _RELEASE_LUA = (
+        "if redis.call('GET', KEYS[1]) == ARGV[1] then "
+        "return redis.call('DEL', KEYS[1]) end return 0"
+    )
+    _REFRESH_LUA = (
+        "if redis.call('GET', KEYS[1]) == ARGV[1] then "
+        "return redis.call('EXPIRE', KEYS[1], ARGV[2]) end return 0"
+    )
+
     def __init__(self, url: str):
         import redis  # type: ignore
 
         self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._release_script = self._client.register_script(self._RELEASE_LUA)
+        self._refresh_script = self._client.register_script(self._REFRESH_LUA)
 
     def acquire(self, seat_id: str, client_id: str, ttl: int) -> bool:
         key = f"lock:seat:{seat_id}"
         return bool(self._client.set(name=key, value=client_id, nx=True, ex=ttl))
 
+    def acquire_many(self, seat_ids: Iterable[str], client_id: str, ttl: int) -> Dict[str, bool]:
+        ids = list(seat_ids)
+        if not ids:
+            return {}
+        with self._client.pipeline(transaction=False) as pipe:  # type: ignore[attr-defined]
+            for seat_id in ids:
+                pipe.set(name=f"lock:seat:{seat_id}", value=client_id, nx=True, ex=ttl)
+            results = pipe.execute()
+        return {seat_id: bool(ok) for seat_id, ok in zip(ids, results)}
+
     def release(self, seat_id: str, client_id: str) -> None:
-        key = f"lock:seat:{seat_id}"
-        with self._client.pipeline() as pipe:  # type: ignore[attr-defined]
-            while True:
-                try:
-                    pipe.watch(key)
-                    current = pipe.get(key)
-                    if current != client_id:
-                        pipe.unwatch()
-                        return
-                    pipe.multi()
-                    pipe.delete(key)
-                    pipe.execute()
-                    return
-                except Exception:  # redis.WatchError and others
-                    continue
+        self._release_script(keys=[f"lock:seat:{seat_id}"], args=[client_id])
 
     def refresh(self, seat_id: str, client_id: str, ttl: int) -> None:
-        key = f"lock:seat:{seat_id}"
-        stored = self._client.get(key)
-        if stored == client_id:
-            self._client.expire(key, ttl)
+        self._refresh_script(keys=[f"lock:seat:{seat_id}"], args=[client_id, ttl])
 
     def cleanup(self, _: Iterable[str]) -> None:  # pragma: no cover
         return
@@ -58,6 +66,16 @@ class SeatLockManager:
             except Exception:
                 self._redis = None
 
+    @staticmethod
+    def _seats_by_id(session: Session, seat_ids: Iterable[str]) -> Dict[str, Seat]:
+        ids = list(seat_ids)
+        if not ids:
+            return {}
+        return {
+            seat.seat_id: seat
+            for seat in session.scalars(select(Seat).where(Seat.seat_id.in_(ids))).all()
+        }
+
     def hold_many(
         self, session: Session, seat_ids: Iterable[str], client_id: str
     ) -> Tuple[List[str], List[str], List[str], Optional[datetime]]:
@@ -67,8 +85,26 @@ class SeatLockManager:
         now = datetime.utcnow()
         expire_at = now + timedelta(seconds=self.ttl_seconds)
 
-        for seat_id in seat_ids:
-            seat = session.get(Seat, seat_id)
+        ids = list(seat_ids)
+        seats = self._seats_by_id(session, ids)
+        holds: Dict[str, Hold] = {
+            hold.seat_id: hold
+            for hold in session.scalars(select(Hold).where(Hold.seat_id.in_(ids))).all()
+        }
+
+        acquired: Dict[str, bool] = {}
+        if self._redis:
+            to_acquire = []
+            for seat_id in ids:
+                seat = seats.get(seat_id)
+                if seat is None or seat.status in {SeatStatus.SOLD, SeatStatus.BLOCKED}:
+                    continue
+                if seat_id not in holds:
+                    to_acquire.append(seat_id)
+            acquired = self._redis.acquire_many(to_acquire, client_id, self.ttl_seconds)
+
+        for seat_id in ids:
+            seat = seats.get(seat_id)
             if seat is None:
                 conflicts.append(seat_id)
                 continue
@@ -76,27 +112,62 @@ class SeatLockManager:
                 conflicts.append(seat_id)
                 continue
 
-            existing_hold: Optional[Hold] = session.scalar(
-                select(Hold).where(Hold.seat_id == seat_id)
-            )
+            existing_hold = holds.get(seat_id)
             if existing_hold:
                 if existing_hold.client_id != client_id:
                     conflicts.append(seat_id)
                     continue
-                existing_hold.expires_at = expire_at
                 refreshed.append(seat_id)
                 if self._redis:
                     self._redis.refresh(seat_id, client_id, self.ttl_seconds)
             else:
-                if self._redis and not self._redis.acquire(seat_id, client_id, self.ttl_seconds):
+                if self._redis and not acquired.get(seat_id, False):
                     conflicts.append(seat_id)
                     continue
-                hold = Hold(seat_id=seat_id, client_id=client_id, expires_at=expire_at)
-                session.add(hold)
                 newly_held.append(seat_id)
 
-            seat.status = SeatStatus.HOLD
-            seat.updated_at = now
+        candidate_ids = newly_held + refreshed
+        if candidate_ids:
+            # Conditional UPDATE instead of read-modify-write: seats sold or
+            # blocked by a concurrent transaction after our SELECT are left
+            # untouched and reported as conflicts.
+            session.execute(
+                update(Seat)
+                .where(
+                    Seat.seat_id.in_(candidate_ids),
+                    Seat.status.notin_([SeatStatus.SOLD, SeatStatus.BLOCKED]),
+                )
+                .values(status=SeatStatus.HOLD, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            transitioned = set(
+                session.scalars(
+                    select(Seat.seat_id).where(
+                        Seat.seat_id.in_(candidate_ids), Seat.status == SeatStatus.HOLD
+                    )
+                ).all()
+            )
+            for bucket in (newly_held, refreshed):
+                for seat_id in [sid for sid in bucket if sid not in transitioned]:
+                    bucket.remove(seat_id)
+                    conflicts.append(seat_id)
+                    if self._redis:
+                        self._redis.release(seat_id, client_id)
+
+        held_ids = newly_held + refreshed
+        if held_ids:
+            # One UPSERT covers both the new holds and the TTL refreshes.
+            insert_fn = pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+            stmt = insert_fn(Hold).values(
+                [
+                    {"seat_id": seat_id, "client_id": client_id, "expires_at": expire_at}
+                    for seat_id in held_ids
+                ]
+            ).on_conflict_do_update(
+                index_elements=["seat_id"],
+                set_={"client_id": client_id, "expires_at": expire_at},
+            )
+            session.execute(stmt)
 
         bucket = newly_held if newly_held else refreshed
         return newly_held, refreshed, conflicts, expire_at if bucket else None
@@ -111,8 +182,9 @@ class SeatLockManager:
         holds = session.scalars(query).all()
         released: List[str] = []
         now = datetime.utcnow()
+        seats = self._seats_by_id(session, [hold.seat_id for hold in holds])
         for hold in holds:
-            seat = session.get(Seat, hold.seat_id)
+            seat = seats.get(hold.seat_id)
             if seat and seat.status == SeatStatus.HOLD:
                 seat.status = SeatStatus.AVAILABLE
                 seat.updated_at = now
@@ -134,9 +206,11 @@ class SeatLockManager:
             select(Hold).where(Hold.seat_id.in_(ids))
         ).all()
         holds_by_id: Dict[str, Hold] = {h.seat_id: h for h in holds}
+        seats = self._seats_by_id(session, ids)
 
+        eligible: List[str] = []
         for seat_id in ids:
-            seat = session.get(Seat, seat_id)
+            seat = seats.get(seat_id)
             hold = holds_by_id.get(seat_id)
             if seat is None or seat.status == SeatStatus.SOLD:
                 skipped.append(seat_id)
@@ -144,12 +218,28 @@ class SeatLockManager:
             if not hold or hold.client_id != client_id or hold.expires_at <= now:
                 skipped.append(seat_id)
                 continue
-            seat.status = SeatStatus.SOLD
-            seat.updated_at = now
-            confirmed.append(seat_id)
-            session.delete(hold)
+            eligible.append(seat_id)
+
+        if eligible:
+            confirmed = list(
+                session.scalars(
+                    update(Seat)
+                    .where(Seat.seat_id.in_(eligible), Seat.status != SeatStatus.SOLD)
+                    .values(status=SeatStatus.SOLD, updated_at=now)
+                    .returning(Seat.seat_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
+            confirmed_set = set(confirmed)
+            skipped.extend(seat_id for seat_id in eligible if seat_id not in confirmed_set)
+            session.execute(
+                delete(Hold)
+                .where(Hold.seat_id.in_(confirmed))
+                .execution_options(synchronize_session=False)
+            )
             if self._redis:
-                self._redis.release(seat_id, client_id)
+                for seat_id in confirmed:
+                    self._redis.release(seat_id, client_id)
         return confirmed, skipped
 
     def remove_holds_for_seat(self, session: Session, seat_id: str) -> bool:
@@ -162,19 +252,36 @@ class SeatLockManager:
             session.delete(hold)
         return True
 
-    def cleanup_expired(self, session: Session) -> List[str]:
-        now = datetime.utcnow()
-        expired_holds = session.scalars(
-            select(Hold).where(Hold.expires_at <= now)
-        ).all()
-        expired_ids: List[str] = []
-        for hold in expired_holds:
-            seat = session.get(Seat, hold.seat_id)
-            if seat and seat.status == SeatStatus.HOLD:
-                seat.status = SeatStatus.AVAILABLE
-                seat.updated_at = now
-                expired_ids.append(seat.seat_id)
+    def cleanup_expired(self, session: Session, batch_size: int = 500) -> List[str]:
+        released: List[str] = []
+        while True:
+            now = datetime.utcnow()
+            expired = session.execute(
+                select(Hold.seat_id, Hold.client_id)
+                .where(Hold.expires_at <= now)
+                .limit(batch_size)
+            ).all()
+            if not expired:
+                break
+            expired_seat_ids = [seat_id for seat_id, _ in expired]
+            released.extend(
+                session.scalars(
+                    update(Seat)
+                    .where(Seat.seat_id.in_(expired_seat_ids), Seat.status == SeatStatus.HOLD)
+                    .values(status=SeatStatus.AVAILABLE, updated_at=now)
+                    .returning(Seat.seat_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
+            session.execute(
+                delete(Hold)
+                .where(Hold.seat_id.in_(expired_seat_ids))
+                .execution_options(synchronize_session=False)
+            )
             if self._redis:
-                self._redis.release(hold.seat_id, hold.client_id)
-            session.delete(hold)
-        return expired_ids
+                for seat_id, client_id in expired:
+                    self._redis.release(seat_id, client_id)
+            session.commit()
+            if len(expired) < batch_size:
+                break
+        return released
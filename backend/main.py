@@ -2,19 +2,22 @@
 
 import asyncio
 import contextlib
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 from uuid import uuid4
 
+import orjson
 from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Header, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from .config import get_settings
-from .database import SessionLocal, get_session
+from .database import get_session
 from .lock import SeatLockManager
 from .models import Hold, Purchase, PurchaseItem, Seat, SeatStatus
 from .schemas import (
@@ -26,6 +29,8 @@ from .schemas import (
     SeatAdminBulkResponse,
     SeatAdminBulkUpdate,
     SeatAdminUpdate,
+    SeatBulkUpdateEvent,
+    SeatBulkUpdatePayload,
     SeatOut,
     SeatUpdateEvent,
     SeatUpdatePayload,
@@ -66,15 +71,24 @@ class ConnectionManager:
         async with self._lock:
             self._connections.pop(websocket, None)
 
-    async def broadcast(self, event: dict) -> None:
+    @staticmethod
+    async def _safe_send(websocket: WebSocket, data: str) -> Optional[WebSocket]:
+        try:
+            await websocket.send_text(data)
+            return None
+        except Exception:
+            return websocket
+
+    async def broadcast(self, data: str) -> None:
         async with self._lock:
-            connections = list(self._connections.items())
-        stale: List[WebSocket] = []
-        for websocket, _ in connections:
-            try:
-                await websocket.send_json(event)
-            except Exception:
-                stale.append(websocket)
+            connections = list(self._connections)
+        if not connections:
+            return
+        results = await asyncio.gather(
+            *(self._safe_send(websocket, data) for websocket in connections),
+            return_exceptions=False,
+        )
+        stale = [ws for ws in results if ws is not None]
         if stale:
             async with self._lock:
                 for ws in stale:
@@ -87,6 +101,26 @@ app.state.lock_manager = lock_manager
 app.state.connection_manager = manager
 app.state.cleanup_task = None
 
+# SQLite allows one writer at a time; serializing write transactions here
+# avoids SQLITE_BUSY retry churn in the busy_timeout window. Server databases
+# handle concurrent writers themselves.
+if settings.database_url.startswith("sqlite"):
+    _write_lock = threading.Lock()
+else:
+    _write_lock = contextlib.nullcontext()
+app.state.write_lock = _write_lock
+
+STATS_CACHE_TTL_SECONDS = 2.0
+
+app.state.seat_version = 0
+app.state.stats_cache = {"version": -1, "expires": 0.0, "data": None}
+_stats_cache_lock = threading.Lock()
+
+
+def _bump_seat_version() -> None:
+    with _stats_cache_lock:
+        app.state.seat_version += 1
+
 
 def _serialize_seat(seat: Seat, hold: Optional[Hold]) -> SeatOut:
     hold_info = None
@@ -151,34 +185,64 @@ def _apply_admin_update(
     return changed, previous_status_value
 
 
-def _get_seats_by_ids(ids: Iterable[str]) -> List[Seat]:
-    session = SessionLocal()
-    try:
-        stmt = select(Seat).where(Seat.seat_id.in_(list(ids)))
-        seats = session.scalars(stmt).all()
-        return seats
-    finally:
-        session.close()
+def _load_seat_with_hold(session: Session, seat_id: str) -> Optional[Tuple[Seat, Optional[Hold]]]:
+    stmt = (
+        select(Seat, Hold)
+        .outerjoin(Hold, Hold.seat_id == Seat.seat_id)
+        .where(Seat.seat_id == seat_id)
+    )
+    row = session.execute(stmt).first()
+    if row is None:
+        return None
+    return row[0], row[1]
+
+
+def _encode_event(event: Union[SeatUpdateEvent, SeatBulkUpdateEvent]) -> str:
+    # Encoded once per event; ConnectionManager.broadcast sends identical
+    # bytes to every connection.
+    return orjson.dumps(event.model_dump(by_alias=True)).decode()
 
 
 async def broadcast_status_change(seat_ids: Iterable[str], from_status: str, to_status: str, by: Optional[str]) -> None:
-    seat_list = _get_seats_by_ids(seat_ids)
-    if not seat_list:
+    # Callers pass ids they just transitioned inside their own session, so no
+    # fresh SessionLocal round trip is needed here.
+    ids = list(seat_ids)
+    if not ids:
         return
     now = datetime.utcnow()
-    for seat in seat_list:
+    for seat_id in ids:
         payload = SeatUpdatePayload(
-            seat_id=seat.seat_id,
+            seat_id=seat_id,
             from_=from_status,
             to=to_status,
             by=by,
             at=now,
         )
         event = SeatUpdateEvent(payload=payload)
-        await manager.broadcast(event.dict(by_alias=True))
+        await manager.broadcast(_encode_event(event))
+
+
+async def broadcast_bulk_status_change(changes: List[Tuple[str, str, str]], by: Optional[str]) -> None:
+    if not changes:
+        return
+    now = datetime.utcnow()
+    groups: Dict[Tuple[str, str], List[str]] = {}
+    for seat_id, previous, current in changes:
+        groups.setdefault((previous, current), []).append(seat_id)
+    for (from_status, to_status), ids in groups.items():
+        payload = SeatBulkUpdatePayload(
+            seat_ids=ids,
+            from_=from_status,
+            to=to_status,
+            by=by,
+            at=now,
+        )
+        event = SeatBulkUpdateEvent(payload=payload)
+        await manager.broadcast(_encode_event(event))
 
 
 async def broadcast_cleanup(seat_ids: Iterable[str]) -> None:
+    _bump_seat_version()
     await broadcast_status_change(seat_ids, "HOLD", "AVAILABLE", "system")
 
 
@@ -225,10 +289,13 @@ def get_seats(floor: int = Query(1, ge=1), session: Session = Depends(get_sessio
 def hold_seats(request: HoldRequest, background_tasks: BackgroundTasks, session: Session = Depends(get_session)):
     if not request.seat_ids:
         return HoldResponse(held=[], refreshed=[], conflicts=[], expire_at=None)
-    newly_held, refreshed, conflicts, expire_at = lock_manager.hold_many(
-        session, request.seat_ids, request.client_id
-    )
-    session.commit()
+    with _write_lock:
+        newly_held, refreshed, conflicts, expire_at = lock_manager.hold_many(
+            session, request.seat_ids, request.client_id
+        )
+        session.commit()
+    if newly_held or refreshed:
+        _bump_seat_version()
     if newly_held:
         background_tasks.add_task(broadcast_status_change, newly_held, "AVAILABLE", "HOLD", request.client_id)
     return HoldResponse(
@@ -241,9 +308,11 @@ def hold_seats(request: HoldRequest, background_tasks: BackgroundTasks, session:
 
 @app.post("/api/release")
 def release_seats(request: ReleaseRequest, background_tasks: BackgroundTasks, session: Session = Depends(get_session)):
-    released = lock_manager.release_by_client(session, request.client_id, request.seat_ids)
-    session.commit()
+    with _write_lock:
+        released = lock_manager.release_by_client(session, request.client_id, request.seat_ids)
+        session.commit()
     if released:
+        _bump_seat_version()
         background_tasks.add_task(broadcast_status_change, released, "HOLD", "AVAILABLE", request.client_id)
     return {"released": released}
 
@@ -260,20 +329,22 @@ def confirm(request: ConfirmRequest, background_tasks: BackgroundTasks, session:
         confirmed_ids = [item.seat_id for item in existing.items]
         return ConfirmResponse(confirmed=confirmed_ids, skipped=[])
 
-    newly_confirmed, skipped = lock_manager.confirm(session, request.seat_ids, request.client_id)
-    if not newly_confirmed:
+    with _write_lock:
+        newly_confirmed, skipped = lock_manager.confirm(session, request.seat_ids, request.client_id)
+        if not newly_confirmed:
+            session.commit()
+            return ConfirmResponse(confirmed=[], skipped=skipped)
+
+        purchase = Purchase(request_id=request.request_id, client_id=request.client_id)
+        session.add(purchase)
+        for seat_id in newly_confirmed:
+            seat = session.get(Seat, seat_id)
+            if seat is None:
+                continue
+            item = PurchaseItem(request_id=request.request_id, seat_id=seat_id, price=seat.price)
+            session.add(item)
         session.commit()
-        return ConfirmResponse(confirmed=[], skipped=skipped)
-
-    purchase = Purchase(request_id=request.request_id, client_id=request.client_id)
-    session.add(purchase)
-    for seat_id in newly_confirmed:
-        seat = session.get(Seat, seat_id)
-        if seat is None:
-            continue
-        item = PurchaseItem(request_id=request.request_id, seat_id=seat_id, price=seat.price)
-        session.add(item)
-    session.commit()
+    _bump_seat_version()
 
     background_tasks.add_task(broadcast_status_change, newly_confirmed, "HOLD", "SOLD", request.client_id)
     return ConfirmResponse(confirmed=newly_confirmed, skipped=skipped)
@@ -287,21 +358,23 @@ def admin_update_seat(
     session: Session = Depends(get_session),
     _: str = Depends(require_admin_token),
 ):
-    seat = session.get(Seat, seat_id)
-    if seat is None:
+    loaded = _load_seat_with_hold(session, seat_id)
+    if loaded is None:
         raise HTTPException(status_code=404, detail="座位不存在")
+    seat, hold = loaded
 
     now = datetime.utcnow()
-    changed, previous_status = _apply_admin_update(session, seat, update, now)
+    with _write_lock:
+        changed, previous_status = _apply_admin_update(session, seat, update, now)
 
-    if not changed:
-        hold = session.scalar(select(Hold).where(Hold.seat_id == seat.seat_id))
-        return _serialize_seat(seat, hold)
+        if not changed:
+            return _serialize_seat(seat, hold)
 
-    session.commit()
-    session.refresh(seat)
+        session.commit()
+    _bump_seat_version()
 
-    hold = session.scalar(select(Hold).where(Hold.seat_id == seat.seat_id))
+    loaded = _load_seat_with_hold(session, seat_id)
+    hold = loaded[1] if loaded else None
 
     if previous_status is not None:
         background_tasks.add_task(
@@ -341,17 +414,19 @@ def admin_bulk_update_seats(
     status_changes: List[Tuple[str, str, str]] = []
     changed_seats: List[Seat] = []
 
-    for seat in seats:
-        changed, previous_status = _apply_admin_update(session, seat, request, now)
-        if changed:
-            changed_seats.append(seat)
-            if previous_status is not None:
-                status_changes.append((seat.seat_id, previous_status, seat.status.value))
+    with _write_lock:
+        for seat in seats:
+            changed, previous_status = _apply_admin_update(session, seat, request, now)
+            if changed:
+                changed_seats.append(seat)
+                if previous_status is not None:
+                    status_changes.append((seat.seat_id, previous_status, seat.status.value))
 
-    if not changed_seats:
-        return SeatAdminBulkResponse(updated=[], missing=missing)
+        if not changed_seats:
+            return SeatAdminBulkResponse(updated=[], missing=missing)
 
-    session.commit()
+        session.commit()
+    _bump_seat_version()
 
     seat_ids = [seat.seat_id for seat in changed_seats]
     holds = session.scalars(select(Hold).where(Hold.seat_id.in_(seat_ids))).all()
@@ -359,21 +434,28 @@ def admin_bulk_update_seats(
 
     serialized = [_serialize_seat(seat, hold_by_id.get(seat.seat_id)) for seat in changed_seats]
 
-    for seat_id, previous, current in status_changes:
-        background_tasks.add_task(
-            broadcast_status_change,
-            [seat_id],
-            previous,
-            current,
-            "admin",
-        )
+    if status_changes:
+        background_tasks.add_task(broadcast_bulk_status_change, status_changes, "admin")
 
     return SeatAdminBulkResponse(updated=serialized, missing=missing)
 
 
 @app.get("/api/stats", response_model=StatsResponse)
 def stats(session: Session = Depends(get_session)):
-    seats = session.scalars(select(Seat)).all()
+    with _stats_cache_lock:
+        cache = app.state.stats_cache
+        version = app.state.seat_version
+        if cache["data"] is not None and cache["version"] == version and time.monotonic() < cache["expires"]:
+            return cache["data"]
+
+    rows = session.execute(
+        select(
+            Seat.tier,
+            Seat.status,
+            func.count().label("count"),
+            func.sum(Seat.price).label("revenue"),
+        ).group_by(Seat.tier, Seat.status)
+    ).all()
     totals = {
         "AVAILABLE": 0,
         "HOLD": 0,
@@ -381,23 +463,30 @@ def stats(session: Session = Depends(get_session)):
         "BLOCKED": 0,
     }
     per_tier: Dict[str, StatsByTier] = {}
-    for seat in seats:
-        totals[seat.status.value] += 1
-        tier = seat.tier or "UNKNOWN"
-        stats_row = per_tier.get(tier)
+    for tier, status, count, revenue in rows:
+        totals[status.value] += count
+        tier_key = tier or "UNKNOWN"
+        stats_row = per_tier.get(tier_key)
         if not stats_row:
-            stats_row = StatsByTier(tier=tier, available=0, hold=0, sold=0, blocked=0, revenue=0)
-            per_tier[tier] = stats_row
-        if seat.status == SeatStatus.AVAILABLE:
-            stats_row.available += 1
-        elif seat.status == SeatStatus.HOLD:
-            stats_row.hold += 1
-        elif seat.status == SeatStatus.SOLD:
-            stats_row.sold += 1
-            stats_row.revenue += seat.price
-        elif seat.status == SeatStatus.BLOCKED:
-            stats_row.blocked += 1
-    return StatsResponse(totals=totals, per_tier=list(per_tier.values()))
+            stats_row = StatsByTier(tier=tier_key, available=0, hold=0, sold=0, blocked=0, revenue=0)
+            per_tier[tier_key] = stats_row
+        if status == SeatStatus.AVAILABLE:
+            stats_row.available += count
+        elif status == SeatStatus.HOLD:
+            stats_row.hold += count
+        elif status == SeatStatus.SOLD:
+            stats_row.sold += count
+            stats_row.revenue += revenue or 0
+        elif status == SeatStatus.BLOCKED:
+            stats_row.blocked += count
+    response = StatsResponse(totals=totals, per_tier=list(per_tier.values()))
+    with _stats_cache_lock:
+        app.state.stats_cache = {
+            "version": version,
+            "expires": time.monotonic() + STATS_CACHE_TTL_SECONDS,
+            "data": response,
+        }
+    return response
 
 
 @app.websocket("/ws")
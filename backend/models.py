@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Enum as SqlEnum, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import Column, DateTime, Enum as SqlEnum, ForeignKey, Index, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 
 from .database import Base
@@ -18,6 +18,7 @@ class SeatStatus(str, Enum):
 
 class Seat(Base):
     __tablename__ = "seats"
+    __table_args__ = (Index("ix_seat_status_floor", "floor", "status"),)
 
     seat_id = Column(String, primary_key=True)
     floor = Column(Integer, nullable=False, index=True)
@@ -38,7 +39,10 @@ class Seat(Base):
 
 class Hold(Base):
     __tablename__ = "holds"
-    __table_args__ = (UniqueConstraint("seat_id", name="uq_hold_seat"),)
+    __table_args__ = (
+        UniqueConstraint("seat_id", name="uq_hold_seat"),
+        Index("ix_hold_expires_seat", "expires_at", "seat_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     seat_id = Column(String, ForeignKey("seats.seat_id", ondelete="CASCADE"), nullable=False)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+import orjson
 from openpyxl import load_workbook
+from openpyxl.styles.colors import COLOR_INDEX
 from openpyxl.utils import column_index_from_string, get_column_letter, range_boundaries
+from sqlalchemy import insert
 
 from .config import get_settings
 from .database import Base, SessionLocal, engine
@@ -17,7 +21,7 @@ settings = get_settings()
 STAGE_RANGE = "I35:AH38"
 
 
-@dataclass
+@dataclass(slots=True)
 class SeatRecord:
     seat_id: str
     floor: int
@@ -32,8 +36,8 @@ class SeatRecord:
 
 
 FLOOR_1_RANGE = "C9:AN32"
-FLOOR_1_SKIP_ROWS = {19}
-FLOOR_1_SKIP_COLS = {column_index_from_string("L"), column_index_from_string("AE")}
+FLOOR_1_SKIP_ROWS = frozenset({19})
+FLOOR_1_SKIP_COLS = frozenset({column_index_from_string("L"), column_index_from_string("AE")})
 
 FLOOR_1_MIN_COL, FLOOR_1_MIN_ROW, FLOOR_1_MAX_COL, FLOOR_1_MAX_ROW = range_boundaries(FLOOR_1_RANGE)
 
@@ -42,48 +46,115 @@ FLOOR_1_LAYOUT_ROWS = [
     for row in range(FLOOR_1_MAX_ROW, FLOOR_1_MIN_ROW - 1, -1)
     if row not in FLOOR_1_SKIP_ROWS
 ]
-FLOOR_1_LAYOUT_ROW_MAP = {row: index + 1 for index, row in enumerate(FLOOR_1_LAYOUT_ROWS)}
+FLOOR_1_LAYOUT_ROW_ARR: List[Optional[int]] = [None] * (FLOOR_1_MAX_ROW + 2)
+for _index, _row in enumerate(FLOOR_1_LAYOUT_ROWS, start=1):
+    FLOOR_1_LAYOUT_ROW_ARR[_row] = _index
 
 FLOOR_1_COLUMN_CENTER_LEFT = column_index_from_string("U")
 FLOOR_1_COLUMN_CENTER_RIGHT = column_index_from_string("V")
 
+FLOOR_1_LAYOUT_COL_ARR: List[Optional[int]] = [None] * (FLOOR_1_MAX_COL + 2)
+for _col in range(FLOOR_1_MIN_COL, FLOOR_1_MAX_COL + 1):
+    if _col == FLOOR_1_COLUMN_CENTER_LEFT:
+        FLOOR_1_LAYOUT_COL_ARR[_col] = 1
+    elif _col == FLOOR_1_COLUMN_CENTER_RIGHT:
+        FLOOR_1_LAYOUT_COL_ARR[_col] = 2
+    elif _col < FLOOR_1_COLUMN_CENTER_LEFT:
+        FLOOR_1_LAYOUT_COL_ARR[_col] = 1 + (FLOOR_1_COLUMN_CENTER_LEFT - _col) * 2
+    else:
+        FLOOR_1_LAYOUT_COL_ARR[_col] = 2 + (_col - FLOOR_1_COLUMN_CENTER_RIGHT) * 2
+
 FLOOR_2_CENTER = "C1:AN4"
 FLOOR_2_LEFT = "A1:A16"
 FLOOR_2_RIGHT = "AP1:AP16"
-FLOOR_2_FORCE_CELLS = {"W3"}
+FLOOR_2_FORCE_CELLS_RC = frozenset({(3, column_index_from_string("W"))})
 
 LEFT_BOUNDARY = column_index_from_string("L")
 RIGHT_BOUNDARY = column_index_from_string("AE")
 
+# Indexed by 1-based column; generous upper bound covers every range we scan.
+COL_LETTER = [None] + [get_column_letter(i) for i in range(1, 200)]
+
 
 def _has_border(cell) -> bool:
-    border = getattr(cell, "border", None)
-    if not border:
+    # Border sides are always Side objects on a real Border, so direct access
+    # with short-circuiting beats four getattr dispatches; EmptyCell (no
+    # border attribute) lands in the except.
+    try:
+        border = cell.border
+        return bool(
+            border.left.style or border.right.style or border.top.style or border.bottom.style
+        )
+    except AttributeError:
         return False
-    return any(getattr(getattr(border, side), "style", None) for side in ("left", "right", "top", "bottom"))
+
+
+def _color_from_rgb(start) -> Optional[str]:
+    return getattr(start, "rgb", None) or None
+
+
+def _color_from_indexed(start) -> Optional[str]:
+    index = getattr(start, "index", None)
+    if index is None:
+        return None
+    try:
+        return COLOR_INDEX[int(index)]
+    except (IndexError, ValueError):
+        return None
+
+
+def _color_from_theme(start) -> Optional[str]:
+    return getattr(start, "rgb", None)
+
+
+_COLOR_DISPATCH = {
+    "rgb": _color_from_rgb,
+    "indexed": _color_from_indexed,
+    "theme": _color_from_theme,
+}
 
 
 def _cell_color(cell) -> Optional[str]:
     fill = getattr(cell, "fill", None)
-    if not fill:
+    if fill is None or fill.patternType is None:
         return None
-    start = getattr(fill, "start_color", None)
-    if not start:
+    start = fill.start_color
+    if start is None:
         return None
-    if getattr(start, "type", "rgb") == "rgb" and getattr(start, "rgb", None):
-        return start.rgb
-    if getattr(start, "type", None) == "indexed" and getattr(start, "index", None) is not None:
-        try:
-            from openpyxl.styles.colors import COLOR_INDEX
-
-            idx = int(start.index)
-            return COLOR_INDEX.get(idx)
-        except Exception:
-            return None
-    if getattr(start, "type", None) == "theme" and getattr(start, "theme", None) is not None:
-        rgb = getattr(start, "rgb", None)
-        return rgb
-    return None
+    handler = _COLOR_DISPATCH.get(getattr(start, "type", "rgb"))
+    return handler(start) if handler else None
+
+
+def _style_key(cell) -> Optional[int]:
+    # Regular cells expose style_id, read-only cells _style_id; EmptyCell has
+    # neither and is never cached.
+    key = getattr(cell, "style_id", None)
+    if key is None:
+        key = getattr(cell, "_style_id", None)
+    return key
+
+
+def _has_border_cached(cell, cache: Dict[int, bool]) -> bool:
+    key = _style_key(cell)
+    if key is None:
+        return _has_border(cell)
+    cached = cache.get(key)
+    if cached is None:
+        cached = cache[key] = _has_border(cell)
+    return cached
+
+
+def _cell_color_cached(cell, color_by_style: Dict[int, Optional[str]]) -> Optional[str]:
+    # One resolved color per style id in use; after the first few rows every
+    # lookup is a single dict get instead of re-walking the fill object.
+    key = _style_key(cell)
+    if key is None:
+        return _cell_color(cell)
+    if key in color_by_style:
+        return color_by_style[key]
+    color = _cell_color(cell)
+    color_by_style[key] = color
+    return color
 
 
 def _zone_for_column(col_index: int, floor: int) -> str:
@@ -102,78 +173,98 @@ def _zone_for_column(col_index: int, floor: int) -> str:
     return f"F{floor}-ZONE"
 
 
-def _iter_cells(ws, ref: str):
-    min_col, min_row, max_col, max_row = range_boundaries(ref)
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            yield row, col, ws.cell(row=row, column=col)
+ZONE_F1 = {col: _zone_for_column(col, floor=1) for col in range(1, len(COL_LETTER))}
+ZONE_F2 = {col: _zone_for_column(col, floor=2) for col in range(1, len(COL_LETTER))}
+
+
+def _make_seat(
+    floor: int,
+    row: int,
+    col: int,
+    zone: str,
+    tier: Optional[str],
+    status: SeatStatus,
+    layout_row: Optional[int],
+    layout_col: Optional[int],
+) -> SeatRecord:
+    # Single construction site for every parser branch; one monomorphic call
+    # the interpreter's inline caches can specialize.
+    return SeatRecord(
+        seat_id=f"{floor}-{row}-{COL_LETTER[col]}",
+        floor=floor,
+        excel_row=row,
+        excel_col=col,
+        zone=zone,
+        tier=tier,
+        price=settings.price_for_tier(tier),
+        status=status,
+        layout_row=layout_row,
+        layout_col=layout_col,
+    )
 
 
-def parse_floor_one(ws) -> List[SeatRecord]:
+def _iter_cells(ws, ref: str):
+    min_col, min_row, max_col, max_row = range_boundaries(ref)
+    rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col)
+    # Track coordinates ourselves: read-only worksheets yield EmptyCell
+    # objects that carry no row/column of their own.
+    for row, row_cells in enumerate(rows, start=min_row):
+        for col, cell in enumerate(row_cells, start=min_col):
+            yield row, col, cell
+
+
+def parse_floor_one(
+    ws,
+    border_cache: Optional[Dict[int, bool]] = None,
+    color_by_style: Optional[Dict[int, Optional[str]]] = None,
+) -> List[SeatRecord]:
     seats: List[SeatRecord] = []
+    border_cache = {} if border_cache is None else border_cache
+    color_by_style = {} if color_by_style is None else color_by_style
     for row, col, cell in _iter_cells(ws, FLOOR_1_RANGE):
         if row in FLOOR_1_SKIP_ROWS:
             continue
         if col in FLOOR_1_SKIP_COLS:
             continue
-        if not _has_border(cell):
+        if not _has_border_cached(cell, border_cache):
             continue
-        tier = settings.tier_for_color(_cell_color(cell))
+        tier = settings.tier_for_color(_cell_color_cached(cell, color_by_style))
         status = SeatStatus.BLOCKED if tier is None else SeatStatus.AVAILABLE
-        zone = _zone_for_column(col, floor=1)
-        col_letter = get_column_letter(col)
-        seat_id = f"1-{row}-{col_letter}"
-        price = settings.price_for_tier(tier)
-        layout_row = FLOOR_1_LAYOUT_ROW_MAP.get(row)
-        if col == FLOOR_1_COLUMN_CENTER_LEFT:
-            layout_col = 1
-        elif col == FLOOR_1_COLUMN_CENTER_RIGHT:
-            layout_col = 2
-        elif col < FLOOR_1_COLUMN_CENTER_LEFT:
-            layout_col = 1 + (FLOOR_1_COLUMN_CENTER_LEFT - col) * 2
-        elif col > FLOOR_1_COLUMN_CENTER_RIGHT:
-            layout_col = 2 + (col - FLOOR_1_COLUMN_CENTER_RIGHT) * 2
-        else:
-            layout_col = None
-
         seats.append(
-            SeatRecord(
-                seat_id=seat_id,
+            _make_seat(
                 floor=1,
-                excel_row=row,
-                excel_col=col,
-                zone=zone,
+                row=row,
+                col=col,
+                zone=ZONE_F1[col],
                 tier=tier,
-                price=price,
                 status=status,
-                layout_row=layout_row,
-                layout_col=layout_col,
+                layout_row=FLOOR_1_LAYOUT_ROW_ARR[row],
+                layout_col=FLOOR_1_LAYOUT_COL_ARR[col],
             )
         )
     return seats
 
 
-def parse_floor_two(ws) -> List[SeatRecord]:
+def parse_floor_two(
+    ws,
+    border_cache: Optional[Dict[int, bool]] = None,
+    color_by_style: Optional[Dict[int, Optional[str]]] = None,
+) -> List[SeatRecord]:
     seats: List[SeatRecord] = []
+    border_cache = {} if border_cache is None else border_cache
+    color_by_style = {} if color_by_style is None else color_by_style
     for row, col, cell in _iter_cells(ws, FLOOR_2_CENTER):
-        col_letter = get_column_letter(col)
-        coordinate = f"{col_letter}{row}"
-        if coordinate not in FLOOR_2_FORCE_CELLS and not _has_border(cell):
+        if (row, col) not in FLOOR_2_FORCE_CELLS_RC and not _has_border_cached(cell, border_cache):
             continue
-        tier = settings.tier_for_color(_cell_color(cell))
+        tier = settings.tier_for_color(_cell_color_cached(cell, color_by_style))
         status = SeatStatus.BLOCKED if tier is None else SeatStatus.AVAILABLE
-        zone = _zone_for_column(col, floor=2)
-        seat_id = f"2-{row}-{col_letter}"
-        price = settings.price_for_tier(tier)
         seats.append(
-            SeatRecord(
-                seat_id=seat_id,
+            _make_seat(
                 floor=2,
-                excel_row=row,
-                excel_col=col,
-                zone=zone,
+                row=row,
+                col=col,
+                zone=ZONE_F2[col],
                 tier=tier,
-                price=price,
                 status=status,
                 layout_row=row,
                 layout_col=col,
@@ -181,20 +272,15 @@ def parse_floor_two(ws) -> List[SeatRecord]:
         )
     for ref in (FLOOR_2_LEFT, FLOOR_2_RIGHT):
         for row, col, cell in _iter_cells(ws, ref):
-            if not _has_border(cell):
+            if not _has_border_cached(cell, border_cache):
                 continue
-            zone = _zone_for_column(col, floor=2)
-            col_letter = get_column_letter(col)
-            seat_id = f"2-{row}-{col_letter}"
             seats.append(
-                SeatRecord(
-                    seat_id=seat_id,
+                _make_seat(
                     floor=2,
-                    excel_row=row,
-                    excel_col=col,
-                    zone=zone,
+                    row=row,
+                    col=col,
+                    zone=ZONE_F2[col],
                     tier=None,
-                    price=0,
                     status=SeatStatus.BLOCKED,
                     layout_row=row,
                     layout_col=col,
@@ -206,30 +292,43 @@ def parse_floor_two(ws) -> List[SeatRecord]:
 def parse_excel(path: Path) -> List[SeatRecord]:
     if not path.exists():
         raise FileNotFoundError(f"Excel file not found: {path}")
-    wb = load_workbook(path, data_only=True)
-    ws = wb.active
-    return parse_floor_one(ws) + parse_floor_two(ws)
+    wb = load_workbook(path, data_only=True, read_only=True)
+    try:
+        ws = wb.active
+        # Both floors live on one sheet, so they share one style universe;
+        # share the caches so floor two starts warm.
+        border_cache: Dict[int, bool] = {}
+        color_by_style: Dict[int, Optional[str]] = {}
+        return parse_floor_one(ws, border_cache, color_by_style) + parse_floor_two(
+            ws, border_cache, color_by_style
+        )
+    finally:
+        wb.close()
 
 
 def persist_seats(seats: Iterable[SeatRecord]) -> None:
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    rows = [
+        {
+            "seat_id": record.seat_id,
+            "floor": record.floor,
+            "excel_row": record.excel_row,
+            "excel_col": record.excel_col,
+            "zone": record.zone,
+            "tier": record.tier,
+            "price": record.price,
+            "status": record.status,
+            "layout_row": record.layout_row,
+            "layout_col": record.layout_col,
+        }
+        for record in seats
+    ]
+    if not rows:
+        return
     session = SessionLocal()
     try:
-        for record in seats:
-            seat = Seat(
-                seat_id=record.seat_id,
-                floor=record.floor,
-                excel_row=record.excel_row,
-                excel_col=record.excel_col,
-                zone=record.zone,
-                tier=record.tier,
-                price=record.price,
-                status=record.status,
-                layout_row=record.layout_row,
-                layout_col=record.layout_col,
-            )
-            session.add(seat)
+        session.execute(insert(Seat), rows)
         session.commit()
     except Exception:
         session.rollback()
@@ -239,15 +338,49 @@ def persist_seats(seats: Iterable[SeatRecord]) -> None:
 
 
 def write_json(seats: Iterable[SeatRecord], output_path: Path) -> None:
-    payload = [
-        {
-            **asdict(record),
-            "status": record.status.value,
-        }
-        for record in seats
-    ]
+    # Stream one encoded record at a time instead of materializing the whole
+    # payload list plus one giant string; peak memory stays per-record.
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    with output_path.open("wb") as f:
+        f.write(b"[")
+        first = True
+        for record in seats:
+            encoded = orjson.dumps(
+                {
+                    "seat_id": record.seat_id,
+                    "floor": record.floor,
+                    "excel_row": record.excel_row,
+                    "excel_col": record.excel_col,
+                    "zone": record.zone,
+                    "tier": record.tier,
+                    "price": record.price,
+                    "status": record.status.value,
+                    "layout_row": record.layout_row,
+                    "layout_col": record.layout_col,
+                }
+            )
+            f.write(encoded if first else b",\n" + encoded)
+            first = False
+        f.write(b"]")
+
+
+def _parse_records(path_str: str) -> List[SeatRecord]:
+    return parse_excel(Path(path_str))
+
+
+async def reload_seats_async(excel_path: Path, output_path: Path) -> int:
+    """Re-run the import pipeline without blocking the event loop.
+
+    Parsing happens in a one-shot worker process, so openpyxl holds the GIL
+    and its workbook memory there instead of in the server; the records come
+    back pickled and are persisted against the shared database here.
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        seats = await loop.run_in_executor(pool, _parse_records, str(excel_path))
+    persist_seats(seats)
+    write_json(seats, output_path)
+    return len(seats)
 
 
 def main() -> None:
@@ -1,8 +1,7 @@
 from datetime import datetime
-from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .models import SeatStatus
 
@@ -26,8 +25,7 @@ class SeatOut(BaseModel):
     updated_at: datetime
     hold: Optional[HoldInfo] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SeatsResponse(BaseModel):
@@ -85,16 +83,31 @@ class SeatUpdatePayload(BaseModel):
     by: Optional[str]
     at: datetime
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SeatUpdateEvent(BaseModel):
     event: str = "seat_update"
     payload: SeatUpdatePayload
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SeatBulkUpdatePayload(BaseModel):
+    seat_ids: List[str]
+    from_: str = Field(alias="from")
+    to: str
+    by: Optional[str]
+    at: datetime
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SeatBulkUpdateEvent(BaseModel):
+    event: str = "seat_bulk_update"
+    payload: SeatBulkUpdatePayload
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SeatAdminUpdate(BaseModel):
@@ -104,7 +117,7 @@ class SeatAdminUpdate(BaseModel):
 
 
 class SeatAdminBulkUpdate(BaseModel):
-    seat_ids: List[str] = Field(..., min_items=1)
+    seat_ids: List[str] = Field(..., min_length=1)
     status: Optional[SeatStatus] = None
     tier: Optional[str] = None
     price: Optional[int] = Field(default=None, ge=0)
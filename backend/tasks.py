@@ -10,10 +10,10 @@ from .lock import SeatLockManager
 Broadcaster = Callable[[Iterable[str]], Awaitable[None]]
 
 
-def _cleanup_once(lock_manager: SeatLockManager) -> Iterable[str]:
+def _cleanup_once(lock_manager: SeatLockManager, batch_size: int) -> Iterable[str]:
     session: Session = SessionLocal()
     try:
-        expired_ids = lock_manager.cleanup_expired(session)
+        expired_ids = lock_manager.cleanup_expired(session, batch_size=batch_size)
         session.commit()
         return expired_ids
     except Exception:
@@ -26,8 +26,14 @@ def _cleanup_once(lock_manager: SeatLockManager) -> Iterable[str]:
 async def cleanup_loop(lock_manager: SeatLockManager, broadcaster: Broadcaster) -> None:
     settings = get_settings()
     interval = max(1, settings.cleanup_interval_seconds)
+    batch_size = max(1, settings.cleanup_batch_size)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + interval
     while True:
-        await asyncio.sleep(interval)
-        expired_ids = _cleanup_once(lock_manager)
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
+        # Advance from the previous deadline, not from now, so slow sweeps do
+        # not drift the cadence.
+        deadline += interval
+        expired_ids = tuple(await asyncio.to_thread(_cleanup_once, lock_manager, batch_size))
         if expired_ids:
             await broadcaster(expired_ids)
@@ -1,4 +1,4 @@
-﻿import type { SeatUpdateEvent } from '../types';
+﻿import type { SeatBulkUpdateEvent, SeatUpdateEvent } from '../types';
 
 type SeatUpdatePayload = NonNullable<SeatUpdateEvent['payload']>;
 type SeatUpdateHandler = (payload: SeatUpdatePayload) => void;
@@ -27,9 +27,14 @@ export function subscribeSeatUpdates({ clientId, onUpdate, onStatus }: Options):
 
     socket.onmessage = (event) => {
       try {
-        const message = JSON.parse(event.data) as SeatUpdateEvent;
+        const message = JSON.parse(event.data) as SeatUpdateEvent | SeatBulkUpdateEvent;
         if (message.event === 'seat_update' && message.payload) {
-          onUpdate(message.payload);
+          onUpdate((message as SeatUpdateEvent).payload!);
+        } else if (message.event === 'seat_bulk_update' && message.payload) {
+          const { seat_ids, ...rest } = (message as SeatBulkUpdateEvent).payload!;
+          for (const seat_id of seat_ids) {
+            onUpdate({ seat_id, ...rest });
+          }
         }
       } catch (error) {
         console.error('WS parse error', error);
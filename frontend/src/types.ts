@@ -64,3 +64,14 @@ export interface SeatUpdateEvent {
   };
   client_id?: string;
 }
+
+export interface SeatBulkUpdateEvent {
+  event: string;
+  payload?: {
+    seat_ids: string[];
+    from: SeatStatus;
+    to: SeatStatus;
+    by?: string;
+    at: string;
+  };
+}
@@ -0,0 +1,40 @@
+"""Quick border/fill dump for a handful of cells.
+
+Opens the workbook read-only and fetches only the requested cells, so a
+run is subsecond instead of parsing the whole sheet DOM.
+"""
+
+from pathlib import Path
+
+from openpyxl import load_workbook
+from openpyxl.utils.cell import coordinate_to_tuple
+
+EXCEL_PATH = Path("data/彩色平面图按舞台.xlsx")
+COORDS = ["V3", "W3", "X3"]
+
+
+def main() -> None:
+    wb = load_workbook(EXCEL_PATH, data_only=False, read_only=True)
+    try:
+        ws = wb.active
+        for coord in COORDS:
+            row, col = coordinate_to_tuple(coord)
+            cell = next(ws.iter_rows(min_row=row, max_row=row, min_col=col, max_col=col))[0]
+            border = getattr(cell, "border", None)
+            fill = getattr(cell, "fill", None)
+            sides = (
+                [
+                    side
+                    for side in ("left", "right", "top", "bottom")
+                    if getattr(getattr(border, side, None), "style", None)
+                ]
+                if border is not None
+                else []
+            )
+            print(f"{coord}: border={sides or None} fill={fill}")
+    finally:
+        wb.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,8 @@
-﻿import os
+import asyncio
+import os
 import shutil
 import signal
-import subprocess
 import sys
-import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -57,62 +56,78 @@ def build_frontend_cmd() -> list[str]:
     ]
 
 
-def terminate(processes: list[subprocess.Popen]) -> None:
+async def terminate(processes: list[asyncio.subprocess.Process]) -> None:
     for process in processes:
-        if process.poll() is not None:
+        if process.returncode is not None:
             continue
         try:
             if os.name == "nt":
                 process.terminate()
             else:
                 process.send_signal(signal.SIGINT)
-        except Exception:
+        except ProcessLookupError:
             continue
     for process in processes:
         try:
-            process.wait(timeout=5)
-        except Exception:
-            continue
-
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            process.kill()
 
-def main() -> None:
-    processes: list[subprocess.Popen] = []
 
+async def run() -> int:
     try:
         backend_cmd = build_backend_cmd()
         frontend_cmd = build_frontend_cmd()
     except FileNotFoundError as exc:
         print(f"[dev] {exc}")
-        sys.exit(1)
+        return 1
 
     env = os.environ.copy()
     env.setdefault("FORCE_COLOR", "1")
 
-    backend = subprocess.Popen(backend_cmd, cwd=ROOT, env=env)
-    processes.append(backend)
+    backend = await asyncio.create_subprocess_exec(*backend_cmd, cwd=ROOT, env=env)
+    frontend = await asyncio.create_subprocess_exec(*frontend_cmd, cwd=FRONTEND_DIR, env=env)
+    processes = [backend, frontend]
 
-    frontend = subprocess.Popen(frontend_cmd, cwd=FRONTEND_DIR, env=env)
-    processes.append(frontend)
-
-    def handle_signal(signum, frame):  # noqa: ANN001
-        terminate(processes)
-        sys.exit(0)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except NotImplementedError:
+            # Windows event loops cannot register handlers; fall back to the
+            # default KeyboardInterrupt path.
+            pass
+
+    # Block until a child exits or we are told to stop — no polling wakeups.
+    backend_waiter = asyncio.create_task(backend.wait())
+    frontend_waiter = asyncio.create_task(frontend.wait())
+    stop_waiter = asyncio.create_task(stop.wait())
+    waiters = {backend_waiter, frontend_waiter, stop_waiter}
+    try:
+        done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        await terminate(processes)
+        return 0
+    finally:
+        for task in waiters:
+            task.cancel()
+
+    await terminate(processes)
+    # Attribute the exit code to the child that actually died first; after
+    # terminate() both have a returncode, so `done` is the only reliable tell.
+    if backend_waiter in done:
+        return backend.returncode or 0
+    if frontend_waiter in done:
+        return frontend.returncode or 0
+    return 0
 
-    signal.signal(signal.SIGINT, handle_signal)
-    signal.signal(signal.SIGTERM, handle_signal)
 
+def main() -> None:
     try:
-        while True:
-            for process in processes:
-                ret = process.poll()
-                if ret is not None:
-                    terminate(processes)
-                    if process is backend:
-                        sys.exit(ret)
-                    sys.exit(ret if ret is not None else 0)
-            time.sleep(0.5)
+        sys.exit(asyncio.run(run()))
     except KeyboardInterrupt:
-        terminate(processes)
+        sys.exit(0)
 
 
 if __name__ == "__main__":